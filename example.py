@@ -28,7 +28,7 @@ def main():
         parser.save_sections_to_files("output_sections")
         print("\nSections have been saved to the 'output_sections' directory")
         print("Each section's text is saved as a .txt file")
-        print("Images are saved as .png files with the naming pattern: section_name_image_N.png")
+        print("Images are saved as .png files named after a hash of their content, so repeated images are stored once")
         
         # Save sections to JSON (with images saved to 'output_images')
         parser.to_json("output_sections/sections.json", image_dir="output_sections/images")
@@ -9,6 +9,9 @@ setup(
         "unstructured[all-docs]",
         "python-docx",
     ],
+    extras_require={
+        "orjson": ["orjson"],
+    },
     python_requires=">=3.8",
     author="Project Delphi",
     description="A Python library for parsing Word documents and splitting them into sections",
@@ -1,3 +1,3 @@
-from .docx_parser import DocxParser, parse_docx
+from .docx_parser import DocxParser, parse_docx, parse_docx_batch
 
-__all__ = ['DocxParser', 'parse_docx']
+__all__ = ['DocxParser', 'parse_docx', 'parse_docx_batch']
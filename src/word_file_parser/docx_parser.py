@@ -1,44 +1,400 @@
 """
-Module for parsing and splitting Word documents into sections using the unstructured library.
+Module for parsing and splitting Word documents into sections.
+
+.docx files are read directly with python-docx; other formats fall back to the
+unstructured partitioning pipeline.
 """
 
-from typing import List, Optional, Dict, Union
-from dataclasses import dataclass
+from typing import IO, Callable, Iterable, Iterator, List, Literal, Optional, Dict, Tuple, Type, Union
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+import io
+import os
 import json
+import re
 import base64
+import hashlib
+import sys
+import uuid
+import zipfile
+
+from docx import Document
+from docx.oxml.ns import qn
+from docx.table import Table as DocxTable
+from docx.text.paragraph import Paragraph
+from lxml import etree
+from unstructured.documents.elements import (
+    Title, NarrativeText, ListItem, Table, Image, FigureCaption, Text, Element, ElementMetadata
+)
+
+try:
+    import orjson
+except ImportError:  # optional, only used to speed up to_json()
+    orjson = None
+
+
+def _dump_json(obj: object, fp: IO[str]) -> None:
+    """json.dump(obj, fp, indent=2, ensure_ascii=False), using orjson when it is installed."""
+    if orjson is not None:
+        fp.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    else:
+        json.dump(obj, fp, indent=2, ensure_ascii=False)
+
+
+# Larger than the default 8 KiB so big section and JSON files need fewer write syscalls.
+_WRITE_BUFFER_SIZE = 1 << 16
+
+_HEADING_RE = re.compile(r"[Hh]eading\s*(\d*)")
 
-from unstructured.partition.auto import partition
-from unstructured.documents.elements import Title, NarrativeText, ListItem, Table, Image, FigureCaption, Text, Element
+# Anything that is not a letter or digit is replaced when building file names.
+_UNSAFE_FILENAME_RE = re.compile(r"[\W_]")
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _safe_filename(title: str) -> str:
+    """Turn a section title into a file-name-safe stem."""
+    return _UNSAFE_FILENAME_RE.sub("_", title)
+
+
+def _unique_stems(titles: Iterable[str]) -> Dict[str, str]:
+    """Map each title to a file-name-safe stem, adding _2, _3, ... when sanitized titles collide."""
+    stems: Dict[str, str] = {}
+    # Compared case-insensitively so distinct titles don't overwrite each other on
+    # case-insensitive file systems either.
+    used = set()
+    for title in titles:
+        stem = candidate = _safe_filename(title)
+        n = 2
+        while candidate.casefold() in used:
+            candidate = f"{stem}_{n}"
+            n += 1
+        used.add(candidate.casefold())
+        stems[title] = candidate
+    return stems
+
+
+# slots=True needs Python 3.10+; older interpreters just keep the per-instance __dict__.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Section:
-    """Represents a section in a document with its title and content."""
+    """Represents a section in a document with its title and content.
+
+    Sections are immutable; build the content list before creating the section.
+    The content is left out of the hash, so sections can be put in sets and dicts.
+    """
     title: str
-    content: List[str]
+    content: List[str] = field(hash=False)
     level: int = 1
 
     def __str__(self) -> str:
         """String representation of the section."""
-        return f"{'#' * self.level} {self.title}\n\n" + "\n".join(self.content)
+        buffer = io.StringIO()
+        self.write_to(buffer)
+        return buffer.getvalue()
+
+    @property
+    def safe_title(self) -> str:
+        """Title with every non-alphanumeric character replaced by an underscore (memoized per title)."""
+        return _safe_filename(self.title)
+
+    def write_to(self, fp: IO[str]) -> None:
+        """Write the section to a text stream without building the full string first."""
+        fp.write("#" * self.level)
+        fp.write(" ")
+        fp.write(self.title)
+        fp.write("\n\n")
+        _write_lines(fp, self.content)
+
+
+def _write_lines(fp: IO[str], lines: List[str]) -> None:
+    """Write lines separated by newlines without joining them into one string first."""
+    if not lines:
+        return
+    fp.write(lines[0])
+    fp.writelines("\n" + line for line in lines[1:])
+
+
+def _image_path(image_dir: Path, data: bytes) -> Path:
+    """Content-addressed file name, so an image repeated across sections is stored once."""
+    return image_dir / f"{hashlib.sha256(data).hexdigest()[:16]}.png"
+
+
+def _write_image(path: Path, data: bytes) -> None:
+    """Write an image unless a file with the same content hash is already there.
+
+    The bytes go to a temporary file that is then renamed into place, so an
+    interrupted write never leaves a truncated file for later runs to skip.
+    """
+    if path.exists():
+        return
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    # Mode 0o666 leaves permissions to the umask, as a plain open(path, "wb") would.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        try:
+            f = os.fdopen(fd, "wb")
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Threads used to overlap image writes. ThreadPoolExecutor starts them lazily, so a
+# pool created for a document without images costs next to nothing.
+_IMAGE_WRITE_WORKERS = 8
+
+
+def _write_images(writes: Dict[Path, bytes], executor: Executor) -> None:
+    """Write image files, overlapping the I/O on executor when there is more than one."""
+    if len(writes) == 1:
+        _write_image(*next(iter(writes.items())))
+    elif writes:
+        # Consume the results so any write error is raised here.
+        list(executor.map(_write_image, writes.keys(), writes.values()))
+
+
+def _heading_depth(style_name: str) -> Optional[int]:
+    """Return the zero-based heading depth for a paragraph style, or None for body text.
+
+    Matches both style names ("Heading 1") and the style ids used in the XML ("Heading1").
+    A bare "Heading" without a number counts as a top-level heading.
+    """
+    if style_name == "Title":
+        return 0
+    m = _HEADING_RE.match(style_name)
+    if m is None:
+        return None
+    return max(int(m.group(1)) - 1, 0) if m.group(1) else 0
+
+
+def _paragraph_to_element(paragraph: Paragraph) -> Optional[Element]:
+    """Convert a python-docx paragraph into an unstructured element."""
+    text = paragraph.text.strip()
+    if not text:
+        return None
+    style_name = paragraph.style.name if paragraph.style is not None else ""
+    depth = _heading_depth(style_name)
+    if depth is not None:
+        return Title(text=text, metadata=ElementMetadata(category_depth=depth))
+    if style_name.startswith("List"):
+        return ListItem(text=text)
+    return NarrativeText(text=text)
+
+
+def _table_to_element(table: DocxTable) -> Optional[Element]:
+    """Convert a python-docx table into an unstructured Table element."""
+    rows = []
+    for row in table.rows:
+        # row.cells repeats a horizontally merged cell once per grid column it spans.
+        seen = set()
+        cells = []
+        for cell in row.cells:
+            if id(cell._tc) not in seen:
+                seen.add(id(cell._tc))
+                cells.append(cell.text.strip())
+        rows.append(" | ".join(cells))
+    text = "\n".join(rows).strip()
+    if not text:
+        return None
+    return Table(text=text)
+
+
+def _docx_elements(file_path: Path) -> List[Element]:
+    """Read a .docx file into elements, keeping tables in document order."""
+    doc = Document(str(file_path))
+    elements: List[Element] = []
+    for child in doc.element.body.iterchildren():
+        if child.tag == qn("w:p"):
+            element = _paragraph_to_element(Paragraph(child, doc))
+        elif child.tag == qn("w:tbl"):
+            element = _table_to_element(DocxTable(child, doc))
+        else:
+            continue
+        if element is not None:
+            elements.append(element)
+    return elements
+
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _iterparse(source: IO[bytes], tag: str) -> Iterator[Tuple[str, etree._Element]]:
+    """iterparse hardened like python-docx's own parser: no entity expansion, no huge trees."""
+    return etree.iterparse(source, events=("end",), tag=tag, resolve_entities=False, huge_tree=False)
+
+
+def _style_names(archive: zipfile.ZipFile) -> Dict[str, str]:
+    """Map style ids to style names from word/styles.xml."""
+    try:
+        styles = archive.open("word/styles.xml")
+    except KeyError:
+        return {}
+    names: Dict[str, str] = {}
+    with styles:
+        for _, style in _iterparse(styles, f"{W_NS}style"):
+            name = style.find(f"{W_NS}name")
+            if name is not None:
+                names[style.get(f"{W_NS}styleId", "")] = name.get(f"{W_NS}val", "")
+            style.clear()
+    return names
+
+
+def _iter_paragraphs_fast(file_path: Path) -> Iterator[Tuple[Optional[int], str]]:
+    """Stream (heading depth, text) pairs straight from word/document.xml.
+
+    Body paragraphs have a depth of None. Headings are matched on style names, as
+    in the python-docx path. Paragraphs inside tables are skipped, and lists and
+    images are not recognized.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        style_names = _style_names(archive)
+        with archive.open("word/document.xml") as xml:
+            for _, p in _iterparse(xml, f"{W_NS}p"):
+                in_table = next(p.iterancestors(f"{W_NS}tbl"), None) is not None
+                text = "" if in_table else "".join(t.text or "" for t in p.iter(f"{W_NS}t")).strip()
+                if text:
+                    style = p.find(f"{W_NS}pPr/{W_NS}pStyle")
+                    style_id = style.get(f"{W_NS}val", "") if style is not None else ""
+                    yield _heading_depth(style_names.get(style_id, style_id)), text
+                # Drop finished paragraphs so memory stays flat on large documents.
+                p.clear()
+                while p.getprevious() is not None:
+                    del p.getparent()[0]
+
+
+def _fast_docx_elements(file_path: Path) -> List[Element]:
+    """Read a .docx file into Title and NarrativeText elements only."""
+    elements: List[Element] = []
+    for depth, text in _iter_paragraphs_fast(file_path):
+        if depth is not None:
+            elements.append(Title(text=text, metadata=ElementMetadata(category_depth=depth)))
+        else:
+            elements.append(NarrativeText(text=text))
+    return elements
+
+
+def _load_elements(file_path: Path, fast: bool = False) -> List[Element]:
+    """Load the elements of a document, using python-docx for .docx files."""
+    if file_path.suffix.lower() == ".docx":
+        return _fast_docx_elements(file_path) if fast else _docx_elements(file_path)
+    # Other formats still need the full unstructured pipeline, which is slow to import.
+    from unstructured.partition.auto import partition
+    return partition(filename=str(file_path))
+
+
+@lru_cache(maxsize=128)
+def _partition_cached(abs_path: str, mtime_ns: int, size: int, fast: bool = False) -> Tuple[Element, ...]:
+    """Load a document's elements, cached by path, modification time, size and mode.
+
+    The elements are shared between every parser of the same file, so callers
+    must not mutate them; deep-copy first if changes are needed.
+    """
+    return tuple(_load_elements(Path(abs_path), fast))
+
+
+def _text_handler(element: Element, out: List[str]) -> None:
+    out.append(element.text)
+
+
+def _table_handler(element: Element, out: List[str]) -> None:
+    out.append("\nTable:\n" + element.text)
+
+
+def _image_handler(element: Element, out: List[str]) -> None:
+    out.append("\n[Image]")
+    caption = getattr(element, "caption", None)
+    if caption:
+        out.append(f"Caption: {caption}")
+
+
+def _caption_handler(element: Element, out: List[str]) -> None:
+    out.append(f"\nCaption: {element.text}")
+
+
+_TextHandler = Callable[[Element, List[str]], None]
+
+# Exact element type -> text formatter. Types missing here are resolved through
+# their MRO on first sight and the result (possibly None) is remembered.
+_TEXT_HANDLERS: Dict[Type[Element], Optional[_TextHandler]] = {
+    NarrativeText: _text_handler,
+    ListItem: _text_handler,
+    Text: _text_handler,
+    Table: _table_handler,
+    Image: _image_handler,
+    FigureCaption: _caption_handler,
+}
+
+
+def _resolve_text_handler(element_type: Type[Element]) -> Optional[_TextHandler]:
+    """Find the handler of the closest registered base class and remember it."""
+    handler = None
+    for base in element_type.__mro__[1:]:
+        if _TEXT_HANDLERS.get(base) is not None:
+            handler = _TEXT_HANDLERS[base]
+            break
+    _TEXT_HANDLERS[element_type] = handler
+    return handler
+
+
+def _elements_text_parts(elements: List[Element]) -> List[str]:
+    """Format a section's elements as a list of plain-text parts."""
+    text_parts: List[str] = []
+    for element in elements:
+        element_type = type(element)
+        try:
+            handler = _TEXT_HANDLERS[element_type]
+        except KeyError:
+            handler = _resolve_text_handler(element_type)
+        if handler is not None:
+            handler(element, text_parts)
+    return text_parts
+
+
+def _elements_text(elements: List[Element]) -> str:
+    """Format a section's elements as plain text."""
+    return "\n".join(_elements_text_parts(elements))
 
 
 class DocxParser:
     """Parser for Word documents that splits them into sections."""
     
-    def __init__(self, file_path: Union[str, Path]):
+    def __init__(self, file_path: Union[str, Path], fast: bool = False):
         """Initialize the parser with a Word document path.
         
         Args:
             file_path: Path to the Word document
+            fast: Stream headings and paragraph text straight from the .docx XML.
+                Much faster on large documents, but only Title and NarrativeText
+                elements are produced: table contents are skipped and lists and
+                images are not recognized. Ignored for formats other than .docx.
         """
         self.file_path = Path(file_path)
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            st = self.file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        self._cache_key = (str(self.file_path.resolve()), st.st_mtime_ns, st.st_size, fast)
         self.sections: Dict[str, List[Element]] = {}
-        self._current_section: Optional[str] = None
-        self._current_elements: List[Element] = []
+        self._title_index: Dict[str, str] = {}
+        self._text_cache: Dict[str, Optional[str]] = {}
+        self._parsed = False
+
+    @property
+    def elements(self) -> Tuple[Element, ...]:
+        """Document elements, loaded on first access and shared across parsers of the same file.
+
+        The elements must not be mutated; deep-copy them first if changes are needed.
+        """
+        return _partition_cached(*self._cache_key)
     
     def parse_sections(self) -> Dict[str, List[Element]]:
         """Parse the document into sections based on headings.
@@ -46,25 +402,16 @@ class DocxParser:
         Returns:
             Dictionary mapping section titles to their content elements
         """
-        elements = partition(filename=str(self.file_path))
-        
-        for element in elements:
-            if isinstance(element, Title):
-                # Save previous section if it exists
-                if self._current_section is not None:
-                    self.sections[self._current_section] = self._current_elements
-                
-                # Start new section
-                self._current_section = element.text
-                self._current_elements = []
-            else:
-                if self._current_section is not None:
-                    self._current_elements.append(element)
-        
-        # Save the last section
-        if self._current_section is not None:
-            self.sections[self._current_section] = self._current_elements
-        
+        self._text_cache.clear()
+        self.sections.clear()
+        elements = self.elements
+        # Each section runs from its Title up to the next one; anything before the first Title is dropped.
+        starts = [i for i, element in enumerate(elements) if isinstance(element, Title)]
+        for start, end in zip(starts, starts[1:] + [len(elements)]):
+            self.sections[elements[start].text] = list(elements[start + 1:end])
+
+        self._title_index = {title.casefold(): title for title in self.sections}
+        self._parsed = True
         return self.sections
     
     def get_section(self, title: str) -> Optional[List[Element]]:
@@ -76,12 +423,30 @@ class DocxParser:
         Returns:
             List of elements in the section, or None if not found
         """
-        if not self.sections:
+        if not self._parsed:
             self.parse_sections()
         return self.sections.get(title)
+
+    def get_section_by_title(self, title: str) -> Optional[List[Element]]:
+        """Get a section by its title, ignoring case.
+
+        Args:
+            title: The section title to retrieve
+
+        Returns:
+            List of elements in the section, or None if not found
+        """
+        if not self._parsed:
+            self.parse_sections()
+        key = self._title_index.get(title.casefold())
+        return self.sections.get(key) if key is not None else None
     
     def get_section_text(self, title: str) -> Optional[str]:
         """Get the text content of a section.
+
+        The result is cached per title until the next parse_sections() call. The
+        save methods and to_json() do not use this cache: they stream text parts
+        straight to their files instead.
         
         Args:
             title: The section title to retrieve
@@ -89,24 +454,14 @@ class DocxParser:
         Returns:
             Formatted text content of the section, or None if not found
         """
+        if title in self._text_cache:
+            return self._text_cache[title]
         elements = self.get_section(title)
-        if not elements:
+        if elements is None:
             return None
-            
-        text_parts = []
-        for element in elements:
-            if isinstance(element, (NarrativeText, ListItem, Text)):
-                text_parts.append(element.text)
-            elif isinstance(element, Table):
-                text_parts.append("\nTable:\n" + element.text)
-            elif isinstance(element, Image):
-                text_parts.append("\n[Image]")
-                if element.caption:
-                    text_parts.append(f"Caption: {element.caption}")
-            elif isinstance(element, FigureCaption):
-                text_parts.append(f"\nCaption: {element.text}")
-        
-        return "\n".join(text_parts)
+        text = _elements_text(elements) if elements else None
+        self._text_cache[title] = text
+        return text
     
     def save_section(self, title: str, output_dir: Union[str, Path]) -> None:
         """Save a section to a text file.
@@ -118,22 +473,31 @@ class DocxParser:
         elements = self.get_section(title)
         if not elements:
             raise ValueError(f"Section not found: {title}")
-            
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        
+        with ThreadPoolExecutor(max_workers=_IMAGE_WRITE_WORKERS) as executor:
+            # Same file name save_sections_to_files() gives this section, so sections
+            # whose sanitized titles collide never overwrite each other's files.
+            stem = _unique_stems(self.sections)[title]
+            self._write_section_elements(stem, elements, output_dir, executor)
+
+    def _write_section_elements(self, stem: str, elements: List[Element], output_dir: Path, executor: Executor) -> None:
+        """Write an already resolved section's text and images into an existing output_dir.
+
+        The text goes to "<stem>.txt"; callers pick stems that don't collide.
+        """
         # Save text content
-        text_content = self.get_section_text(title)
-        if text_content:
-            text_file = output_dir / f"{title}.txt"
-            text_file.write_text(text_content)
+        text_parts = _elements_text_parts(elements)
+        if any(text_parts):
+            text_file = output_dir / f"{stem}.txt"
+            with open(os.fspath(text_file), "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                _write_lines(f, text_parts)
         
         # Save images if any
-        for i, element in enumerate(elements):
-            if isinstance(element, Image) and element.image:
-                image_file = output_dir / f"{title}_image_{i+1}.png"
-                with open(image_file, 'wb') as f:
-                    f.write(element.image)
+        images = [
+            getattr(element, "image", None) for element in elements if isinstance(element, Image)
+        ]
+        _write_images({_image_path(output_dir, data): data for data in images if data}, executor)
     
     def save_sections_to_files(self, output_dir: Union[str, Path]) -> None:
         """Save all sections to text files.
@@ -141,64 +505,101 @@ class DocxParser:
         Args:
             output_dir: Directory to save the section files
         """
-        if not self.sections:
+        if not self._parsed:
             self.parse_sections()
             
-        for title in self.sections:
-            self.save_section(title, output_dir)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stems = _unique_stems(self.sections)
+        with ThreadPoolExecutor(max_workers=_IMAGE_WRITE_WORKERS) as executor:
+            for title, elements in self.sections.items():
+                self._write_section_elements(stems[title], elements, output_dir, executor)
     
-    def to_json(self, output_path: Union[str, Path], image_dir: Optional[Union[str, Path]] = None) -> None:
+    def to_json(self, output_path: Union[str, Path], image_dir: Optional[Union[str, Path, Literal[False]]] = None) -> None:
         """Export the parsed sections and their elements to a JSON file.
 
         Args:
             output_path: Path to the output JSON file
-            image_dir: Directory to save images (if not already saved). If None, images are not saved.
+            image_dir: Directory to save images in. If None, images go to a "<json stem>_images"
+                directory next to the JSON file. If False, images are embedded as base64 instead.
+
+        Raises:
+            ValueError: If image_dir is an empty string
         """
-        if not self.sections:
+        if isinstance(image_dir, str) and not image_dir:
+            raise ValueError("image_dir must be a directory path, None or False")
+        if not self._parsed:
             self.parse_sections()
-        
-        output = []
-        for section_title, elements in self.sections.items():
-            section_data = {
-                "title": section_title,
-                "elements": []
-            }
-            for i, element in enumerate(elements):
-                elem_type = type(element).__name__
-                elem_data = {"type": elem_type}
-                if hasattr(element, "text"):
-                    elem_data["text"] = element.text
-                if hasattr(element, "caption") and element.caption:
-                    elem_data["caption"] = element.caption
-                if elem_type == "Table":
-                    elem_data["table_text"] = element.text
-                if elem_type == "Image" and getattr(element, "image", None):
-                    if image_dir:
-                        image_dir_path = Path(image_dir)
-                        image_dir_path.mkdir(parents=True, exist_ok=True)
-                        image_file = image_dir_path / f"{section_title}_image_{i+1}.png"
-                        with open(image_file, 'wb') as f:
-                            f.write(element.image)
-                        elem_data["image_file"] = str(image_file)
-                    else:
-                        # Optionally, base64 encode the image
-                        elem_data["image_base64"] = base64.b64encode(element.image).decode("utf-8")
-                section_data["elements"].append(elem_data)
-            output.append(section_data)
-        
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+
+        if image_dir is False:
+            image_dir_path = None
+        else:
+            if image_dir is None:
+                image_dir = output_path.parent / f"{output_path.stem}_images"
+            image_dir_path = Path(image_dir)
+            if self._has_images():
+                image_dir_path.mkdir(parents=True, exist_ok=True)
+
+        # Write the array one section at a time so only one section's data is held in memory.
+        with open(os.fspath(output_path), "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f, \
+                ThreadPoolExecutor(max_workers=_IMAGE_WRITE_WORKERS) as executor:
+            f.write("[\n")
+            first = True
+            for section_title, elements in self.sections.items():
+                if not first:
+                    f.write(",\n")
+                _dump_json(self._section_to_dict(section_title, elements, image_dir_path, executor), f)
+                first = False
+            f.write("\n]")
+
+    def _has_images(self) -> bool:
+        """Whether any section contains an image with data."""
+        return any(
+            isinstance(element, Image) and getattr(element, "image", None)
+            for elements in self.sections.values()
+            for element in elements
+        )
+
+    def _section_to_dict(self, section_title: str, elements: List[Element], image_dir: Optional[Path], executor: Executor) -> Dict:
+        """Build the JSON representation of one section, writing its images to image_dir if given."""
+        section_data = {
+            "title": section_title,
+            "elements": []
+        }
+        image_writes: Dict[Path, bytes] = {}
+        for element in elements:
+            elem_type = type(element).__name__
+            elem_data = {"type": elem_type}
+            text = getattr(element, "text", None)
+            if text is not None:
+                elem_data["text"] = text
+            caption = getattr(element, "caption", None)
+            if caption:
+                elem_data["caption"] = caption
+            if elem_type == "Table":
+                elem_data["table_text"] = text
+            if elem_type == "Image" and getattr(element, "image", None):
+                if image_dir is not None:
+                    image_file = _image_path(image_dir, element.image)
+                    image_writes[image_file] = element.image
+                    elem_data["image_file"] = str(image_file)
+                else:
+                    elem_data["image_base64"] = base64.b64encode(element.image).decode("ascii")
+            section_data["elements"].append(elem_data)
+        _write_images(image_writes, executor)
+        return section_data
 
     @classmethod
-    def parse_docx_to_json(cls, file_path: Union[str, Path], json_path: Union[str, Path], image_dir: Optional[Union[str, Path]] = None) -> None:
+    def parse_docx_to_json(cls, file_path: Union[str, Path], json_path: Union[str, Path], image_dir: Optional[Union[str, Path, Literal[False]]] = None) -> None:
         """Convenience function to parse a docx file and output JSON.
 
         Args:
             file_path: Path to the Word document
             json_path: Path to the output JSON file
-            image_dir: Directory to save images (optional)
+            image_dir: Directory to save images (optional, see to_json)
         """
         parser = cls(file_path)
         parser.to_json(json_path, image_dir=image_dir)
@@ -215,4 +616,24 @@ def parse_docx(file_path: str) -> List[Section]:
         List[Section]: List of sections in the document
     """
     parser = DocxParser(file_path)
-    return parser.parse_sections() 
\ No newline at end of file
+    return parser.parse_sections()
+
+
+def parse_docx_batch(file_paths: Iterable[str], workers: Optional[int] = None) -> Dict[str, Dict[str, List[Element]]]:
+    """
+    Parse several Word documents in parallel worker processes.
+
+    Parsing is CPU-bound, so processes are used rather than threads. Worker startup
+    stays cheap under the "spawn" and "forkserver" start methods because unstructured's
+    partition pipeline is only imported by a worker that meets a non-.docx file.
+
+    Args:
+        file_paths (Iterable[str]): Paths to the Word documents
+        workers (Optional[int]): Number of worker processes, defaults to the CPU count
+
+    Returns:
+        Dict[str, Dict[str, List[Element]]]: Parsed sections keyed by file path
+    """
+    file_paths = list(file_paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(file_paths, executor.map(parse_docx, file_paths)))
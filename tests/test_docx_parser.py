@@ -1,8 +1,14 @@
+import base64
+import io
+from concurrent.futures import ThreadPoolExecutor
 import os
 import pytest
 from pathlib import Path
-from word_file_parser import DocxParser
-from unstructured.documents.elements import Image, Table, ListItem
+from docx import Document
+from word_file_parser import DocxParser, parse_docx_batch
+from word_file_parser import docx_parser as parser_module
+from word_file_parser.docx_parser import Section, _elements_text, _heading_depth, _write_image, _write_images
+from unstructured.documents.elements import Header, Image, Table, ListItem, NarrativeText, Title
 import json
 
 @pytest.fixture
@@ -15,6 +21,26 @@ def docx_parser(sample_docx_path):
     """Create a DocxParser instance for testing."""
     return DocxParser(sample_docx_path)
 
+@pytest.fixture
+def structured_docx_path(tmp_path):
+    """Create a docx file with a list and a table between headings."""
+    doc = Document()
+    doc.add_heading('Overview', level=1)
+    doc.add_paragraph('Before the table.')
+    doc.add_paragraph('First item', style='List Bullet')
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = 'A'
+    # A heading-styled cell must not start a section.
+    table.cell(0, 0).paragraphs[0].style = 'Heading 2'
+    table.cell(0, 1).text = 'B'
+    table.cell(1, 0).merge(table.cell(1, 1)).text = 'Merged'
+    doc.add_paragraph('After the table.')
+    doc.add_heading('Details', level=2)
+    doc.add_paragraph('Details text.')
+    path = tmp_path / 'structured.docx'
+    doc.save(str(path))
+    return str(path)
+
 def test_init(docx_parser, sample_docx_path):
     """Test DocxParser initialization."""
     assert str(docx_parser.file_path) == sample_docx_path
@@ -70,10 +96,10 @@ def test_save_section(tmp_path, docx_parser):
         except ValueError:
             pass
         # Check text file exists if content was saved
-        text_file = output_dir / f"{section}.txt"
-        if text_file.exists():
-            content = text_file.read_text()
-            assert isinstance(content, str)
+        text_file = output_dir / f"{Section(section, []).safe_title}.txt"
+        if docx_parser.get_section_text(section):
+            assert text_file.exists()
+            assert isinstance(text_file.read_text(encoding="utf-8"), str)
 
 def test_parse_docx(sample_docx_path, tmp_path):
     """Test the convenience function for parsing docx files to JSON."""
@@ -118,4 +144,264 @@ def test_to_json(tmp_path, docx_parser):
                 assert "image_file" in elem or "image_base64" in elem
                 if "image_file" in elem:
                     img_path = Path(elem["image_file"])
-                    assert img_path.exists() 
\ No newline at end of file
+                    assert img_path.exists() 
+
+def test_get_section_by_title(docx_parser):
+    """Test case-insensitive section lookup."""
+    assert docx_parser.get_section_by_title("NonExistentSection") is None
+    for section in docx_parser.sections:
+        assert docx_parser.get_section_by_title(section.upper()) is docx_parser.sections[section]
+
+def test_section_write_to():
+    """Test that Section.write_to matches its string representation."""
+    section = Section(title="Intro", content=["First line.", "Second line."], level=2)
+    buffer = io.StringIO()
+    section.write_to(buffer)
+    assert buffer.getvalue() == "## Intro\n\nFirst line.\nSecond line."
+    assert str(section) == buffer.getvalue()
+
+def test_parse_docx_batch(sample_docx_path):
+    """Test parsing several files in worker processes."""
+    results = parse_docx_batch([sample_docx_path], workers=1)
+    assert list(results) == [sample_docx_path]
+    assert results[sample_docx_path].keys() == DocxParser(sample_docx_path).parse_sections().keys()
+
+def test_fast_parse_sections(sample_docx_path, docx_parser):
+    """Test that the streaming XML path finds the same sections."""
+    fast_parser = DocxParser(sample_docx_path, fast=True)
+    assert list(fast_parser.parse_sections()) == list(docx_parser.parse_sections())
+
+def test_fast_parse_sections_with_table(structured_docx_path):
+    """Test that the streaming XML path ignores table contents like the default path."""
+    sections = DocxParser(structured_docx_path).parse_sections()
+    fast_sections = DocxParser(structured_docx_path, fast=True).parse_sections()
+    assert list(fast_sections) == list(sections) == ['Overview', 'Details']
+    assert [e.text for e in fast_sections['Overview']] == [
+        'Before the table.', 'First item', 'After the table.'
+    ]
+
+def test_docx_elements(structured_docx_path):
+    """Test element classification and order for python-docx parsing."""
+    elements = DocxParser(structured_docx_path).elements
+    assert [type(e) for e in elements] == [Title, NarrativeText, ListItem, Table, NarrativeText, Title, NarrativeText]
+    assert elements[2].text == 'First item'
+    # The merged row appears once, not once per grid column.
+    assert elements[3].text == 'A | B\nMerged'
+
+def test_elements_cache(tmp_path):
+    """Test that parsers share cached elements until the file changes."""
+    path = tmp_path / 'cached.docx'
+    doc = Document()
+    doc.add_heading('Original', level=1)
+    doc.add_paragraph('Original text.')
+    doc.save(str(path))
+    assert DocxParser(path).elements is DocxParser(path).elements
+
+    doc = Document()
+    doc.add_heading('Rewritten', level=1)
+    doc.add_paragraph('Rewritten text that is longer than before.')
+    doc.save(str(path))
+    assert list(DocxParser(path).parse_sections()) == ['Rewritten']
+
+def test_save_sections_to_files_colliding_titles(tmp_path):
+    """Test that titles sanitizing to the same name are all written."""
+    path = tmp_path / 'colliding.docx'
+    doc = Document()
+    for title in ('A B', 'A/B', 'A-B'):
+        doc.add_heading(title, level=1)
+        doc.add_paragraph(f'Text of {title}.')
+    doc.save(str(path))
+
+    output_dir = tmp_path / 'sections'
+    DocxParser(path).save_sections_to_files(output_dir)
+    contents = {f.name: f.read_text(encoding='utf-8') for f in output_dir.glob('*.txt')}
+    assert contents == {
+        'A_B.txt': 'Text of A B.',
+        'A_B_2.txt': 'Text of A/B.',
+        'A_B_3.txt': 'Text of A-B.',
+    }
+
+    single_dir = tmp_path / 'single'
+    DocxParser(path).save_section('A/B', single_dir)
+    assert [f.name for f in single_dir.glob('*.txt')] == ['A_B_2.txt']
+
+def test_elements_text_formatting():
+    """Test per-type text formatting, including subclasses resolved through the MRO."""
+    class ChunkedTable(Table):
+        pass
+
+    elements = [
+        NarrativeText(text='Body'),
+        Table(text='a | b'),
+        Image(text='picture'),
+        Header(text='Running header'),
+        ChunkedTable(text='c | d'),
+    ]
+    assert _elements_text(elements) == (
+        "Body\n"
+        "\nTable:\na | b\n"
+        "\n[Image]\n"
+        "Running header\n"
+        "\nTable:\nc | d"
+    )
+
+def _image_element(data):
+    """Build an Image element carrying raw image bytes."""
+    element = Image(text='image')
+    element.image = data
+    return element
+
+def test_to_json_default_image_dir(tmp_path, docx_parser):
+    """Test that images go to a '<stem>_images' directory by default."""
+    docx_parser.parse_sections()
+    docx_parser.sections['Figures'] = [_image_element(b'png bytes')]
+    json_path = tmp_path / 'out.json'
+    docx_parser.to_json(json_path)
+
+    data = json.loads(json_path.read_text(encoding='utf-8'))
+    image_elem = data[-1]['elements'][0]
+    assert 'image_base64' not in image_elem
+    image_file = Path(image_elem['image_file'])
+    assert image_file.parent == tmp_path / 'out_images'
+    assert image_file.read_bytes() == b'png bytes'
+
+def test_to_json_base64_images(tmp_path, docx_parser):
+    """Test that image_dir=False embeds images as base64 instead of writing files."""
+    docx_parser.parse_sections()
+    docx_parser.sections['Figures'] = [_image_element(b'png bytes')]
+    json_path = tmp_path / 'out.json'
+    docx_parser.to_json(json_path, image_dir=False)
+
+    data = json.loads(json_path.read_text(encoding='utf-8'))
+    image_elem = data[-1]['elements'][0]
+    assert 'image_file' not in image_elem
+    assert base64.b64decode(image_elem['image_base64']) == b'png bytes'
+    assert not (tmp_path / 'out_images').exists()
+
+def test_to_json_empty_image_dir(tmp_path, docx_parser):
+    """Test that an empty image_dir is rejected rather than meaning the working directory."""
+    with pytest.raises(ValueError):
+        docx_parser.to_json(tmp_path / 'out.json', image_dir='')
+
+@pytest.mark.parametrize("style_name, depth", [
+    ("Title", 0),
+    ("Heading 1", 0),
+    ("Heading1", 0),
+    ("heading 3", 2),
+    ("Heading", 0),
+    ("Normal", None),
+    ("", None),
+])
+def test_heading_depth(style_name, depth):
+    """Test heading depth detection from style names and ids."""
+    assert _heading_depth(style_name) == depth
+
+def test_write_images_pooled_error(tmp_path):
+    """Test that a failing write on the thread pool reaches the caller."""
+    writes = {
+        tmp_path / 'a.png': b'a',
+        tmp_path / 'missing' / 'b.png': b'b',
+    }
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(FileNotFoundError):
+            _write_images(writes, executor)
+    assert (tmp_path / 'a.png').read_bytes() == b'a'
+
+def test_to_json_deduplicates_images(tmp_path, docx_parser):
+    """Test that an image repeated across sections is stored once and referenced twice."""
+    docx_parser.parse_sections()
+    docx_parser.sections['Logo 1'] = [_image_element(b'logo')]
+    docx_parser.sections['Logo 2'] = [_image_element(b'logo')]
+    image_dir = tmp_path / 'images'
+    docx_parser.to_json(tmp_path / 'out.json', image_dir=image_dir)
+
+    data = json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+    refs = [elem['image_file'] for section in data for elem in section['elements'] if elem['type'] == 'Image']
+    assert len(refs) == 2
+    assert refs[0] == refs[1]
+    assert [f.name for f in image_dir.iterdir()] == [Path(refs[0]).name]
+
+def test_get_section_text_cache(docx_parser, monkeypatch):
+    """Test that section text is cached per title and reset by parse_sections."""
+    calls = []
+    elements_text = parser_module._elements_text
+
+    def counting_elements_text(elements):
+        calls.append(elements)
+        return elements_text(elements)
+
+    monkeypatch.setattr(parser_module, "_elements_text", counting_elements_text)
+    title = next(title for title, elements in docx_parser.parse_sections().items() if elements)
+
+    text = docx_parser.get_section_text(title)
+    assert docx_parser.get_section_text(title) is text
+    assert len(calls) == 1
+
+    docx_parser.parse_sections()
+    assert docx_parser.get_section_text(title) == text
+    assert len(calls) == 2
+
+    assert docx_parser.get_section_text("NonExistentSection") is None
+    assert "NonExistentSection" not in docx_parser._text_cache
+
+def test_sectionless_document_parsed_once(tmp_path, monkeypatch):
+    """Test that a document without headings is not re-parsed on every lookup."""
+    path = tmp_path / 'no_headings.docx'
+    doc = Document()
+    doc.add_paragraph('Just body text.')
+    doc.save(str(path))
+
+    calls = []
+    parse_sections = DocxParser.parse_sections
+
+    def counting_parse_sections(self):
+        calls.append(self)
+        return parse_sections(self)
+
+    monkeypatch.setattr(DocxParser, "parse_sections", counting_parse_sections)
+    parser = DocxParser(path)
+    assert parser.get_section("X") is None
+    assert parser.get_section("X") is None
+    assert parser.sections == {}
+    assert len(calls) == 1
+
+def test_save_sections_image_without_bytes(tmp_path, docx_parser):
+    """Test that Image elements without image bytes are saved as text only."""
+    docx_parser.parse_sections()
+    docx_parser.sections['Figures'] = [Image(text='A figure')]
+    output_dir = tmp_path / 'sections'
+    docx_parser.save_sections_to_files(output_dir)
+    docx_parser.save_section('Figures', output_dir / 'single')
+
+    assert (output_dir / 'Figures.txt').read_text(encoding='utf-8') == '\n[Image]'
+    assert list(output_dir.glob('*.png')) == []
+
+def test_write_image_permissions(tmp_path):
+    """Test that atomically written images get umask-based permissions and leave no temp files."""
+    old_umask = os.umask(0o022)
+    try:
+        _write_image(tmp_path / 'image.png', b'png bytes')
+    finally:
+        os.umask(old_umask)
+    assert (tmp_path / 'image.png').stat().st_mode & 0o777 == 0o644
+    assert [f.name for f in tmp_path.iterdir()] == ['image.png']
+
+def test_to_json_serializer_parity(tmp_path, docx_parser, monkeypatch):
+    """Test that the orjson and stdlib json branches write the same document."""
+    pytest.importorskip("orjson")
+    docx_parser.parse_sections()
+    docx_parser.sections['Résumé – 概要'] = [NarrativeText(text='Ünïcödé body — 本文')]
+
+    orjson_path = tmp_path / 'orjson.json'
+    docx_parser.to_json(orjson_path, image_dir=False)
+    monkeypatch.setattr(parser_module, "orjson", None)
+    stdlib_path = tmp_path / 'stdlib.json'
+    docx_parser.to_json(stdlib_path, image_dir=False)
+
+    orjson_text = orjson_path.read_text(encoding='utf-8')
+    stdlib_text = stdlib_path.read_text(encoding='utf-8')
+    assert json.loads(orjson_text) == json.loads(stdlib_text)
+    # Both branches write non-ASCII characters as-is rather than \u escapes.
+    for text in (orjson_text, stdlib_text):
+        assert 'Résumé – 概要' in text
+        assert 'Ünïcödé body — 本文' in text